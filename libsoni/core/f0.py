@@ -1,4 +1,5 @@
 import numpy as np
+from typing import List
 
 from libsoni.core.methods import generate_tone_instantaneous_phase
 from libsoni.util.utils import normalize_signal, fade_signal
@@ -12,6 +13,8 @@ def sonify_f0(time_f0: np.ndarray,
               sonification_duration: int = None,
               fading_duration: float = 0.05,
               normalize: bool = True,
+              out: np.ndarray = None,
+              dtype: np.dtype = np.float32,
               fs: int = 22050) -> np.ndarray:
     """Sonifies a F0 trajectory given as 2D Numpy array.
 
@@ -51,6 +54,16 @@ def sonify_f0(time_f0: np.ndarray,
     normalize: bool, default = True
         Determines if output signal is normalized to [-1,1].
 
+    out: np.ndarray (np.float32 / np.float64) [shape=(M, )], default = None
+        Buffer to accumulate the sonification into.
+        When given, the sonification is added to the buffer in place and no normalization
+        is applied, so callers mixing several trajectories can normalize once at the end.
+
+    dtype: np.dtype, default = np.float32
+        Dtype of the output signal.
+        The instantaneous phase is always accumulated in double precision;
+        the dtype only affects the synthesized output samples.
+
     fs: int, default = 22050
         Sampling rate, in samples per seconds.
 
@@ -69,11 +82,160 @@ def sonify_f0(time_f0: np.ndarray,
         assert len(gains) == time_f0.shape[0], 'Array for confidence must have same length as time_f0.'
     else:
         gains = np.ones(time_f0.shape[0])
-    time_positions = time_f0[:, 0]
-    f0s = time_f0[:, 1]
-    num_samples = int(time_positions[-1] * fs)
+    # Columns of time_f0 are strided views; make them contiguous once so the
+    # downstream vectorized operations run on SIMD-friendly layouts.
+    time_positions = np.ascontiguousarray(time_f0[:, 0])
+    f0s = np.ascontiguousarray(time_f0[:, 1])
+
+    f0s_stretched, gains_stretched = __stretch_f0_and_gains(time_positions=time_positions,
+                                                            f0s=f0s,
+                                                            gains=gains,
+                                                            sonification_duration=sonification_duration,
+                                                            fs=fs)
+
+    f0_sonification = generate_tone_instantaneous_phase(frequency_vector=f0s_stretched,
+                                                        gain_vector=gains_stretched,
+                                                        partials=partials,
+                                                        partials_amplitudes=partials_amplitudes,
+                                                        partials_phase_offsets=partials_phase_offsets,
+                                                        fading_duration=fading_duration,
+                                                        dtype=dtype,
+                                                        fs=fs)
+
+    f0_sonification = fade_signal(f0_sonification, fs=fs, fading_duration=fading_duration)
+
+    if out is not None:
+        num_out = min(out.shape[0], f0_sonification.shape[0])
+        out[:num_out] += f0_sonification[:num_out]
+        return out
+
+    f0_sonification = normalize_signal(f0_sonification) if normalize else f0_sonification
+
+    return f0_sonification
+
+
+def sonify_f0_multi(time_f0s: List[np.ndarray],
+                    gains: List[np.ndarray] = None,
+                    partials: np.ndarray = np.array([1]),
+                    partials_amplitudes: np.ndarray = np.array([1]),
+                    partials_phase_offsets: np.ndarray = None,
+                    sonification_duration: int = None,
+                    fading_duration: float = 0.05,
+                    normalize: bool = True,
+                    dtype: np.dtype = np.float32,
+                    fs: int = 22050) -> np.ndarray:
+    """Sonifies multiple F0 trajectories into a single mix.
+
+    All trajectories share the partial configuration and are synthesized into one output buffer.
+    The stretched trajectory buffers are reused across the trajectories,
+    so no per-trajectory full-length scratch arrays are allocated.
+
+    Parameters
+    ----------
+    time_f0s: List[np.ndarray (np.float32 / np.float64) [shape=(N, 2)]]
+        List of 2D arrays of time positions and f0s, one per trajectory.
+
+    gains: List[np.ndarray (np.float32 / np.float64) [shape=(N, )]], default = None
+        List of arrays containing gain values for the f0 values, one per trajectory.
+
+    partials: np.ndarray (np.float32 / np.float64) [shape=(N, )], default = [1]
+        Array containing the desired partials of the fundamental frequencies for sonification.
+        An array [1] leads to sonification with only the fundamental frequency,
+        while an array [1,2] leads to sonification with the fundamental frequency and twice the fundamental frequency.
+
+    partials_amplitudes: np.ndarray (np.float32 / np.float64) [shape=(N, )], default = None
+        Array containing the amplitudes for partials.
+        An array [1,0.5] causes the first partial to have amplitude 1,
+        while the second partial has amplitude 0.5.
+        If None, the amplitudes for all partials are set to 1.
+
+    partials_phase_offsets: np.ndarray (np.float32 / np.float64) [shape=(N, )], default = None
+        Array containing the phase offsets for partials.
+        When not defined, the phase offsets for all partials are set to 0.
+
+    sonification_duration: int, default = None
+        Determines duration of sonification, in samples.
+        When not defined, the duration is taken from the longest trajectory.
+
+    fading_duration: float, default = 0.05
+        Determines duration of fade-in and fade-out at beginning and end of each trajectory, in seconds.
+
+    normalize: bool, default = True
+        Determines if output signal is normalized to [-1,1].
+
+    dtype: np.dtype, default = np.float32
+        Dtype of the output signal.
+        The instantaneous phase is always accumulated in double precision;
+        the dtype only affects the synthesized output samples.
+
+    fs: int, default = 22050
+        Sampling rate, in samples per seconds.
+
+    Returns
+    -------
+    f0_sonification: np.ndarray (np.float32 / np.float64) [shape=(M, )]
+        Sonified mix of the f0-trajectories.
+    """
+    if gains is not None:
+        assert len(gains) == len(time_f0s), 'List of gain arrays must have same length as time_f0s.'
+
+    if sonification_duration is None:
+        sonification_duration = max(int(time_f0[-1, 0] * fs) for time_f0 in time_f0s)
+
+    f0_sonification = np.zeros(sonification_duration, dtype=dtype)
+
+    f0s_stretched = None
+    gains_stretched = None
+
+    for trajectory_index, time_f0 in enumerate(time_f0s):
+        if time_f0.ndim != 2 or time_f0.shape[1] != 2:
+            raise IndexError('time_f0 must be a numpy array of size [N, 2]')
+
+        if gains is not None:
+            trajectory_gains = gains[trajectory_index]
+            assert len(trajectory_gains) == time_f0.shape[0], \
+                'Array for confidence must have same length as time_f0.'
+        else:
+            trajectory_gains = np.ones(time_f0.shape[0])
+
+        f0s_stretched, gains_stretched = __stretch_f0_and_gains(time_positions=np.ascontiguousarray(time_f0[:, 0]),
+                                                                f0s=np.ascontiguousarray(time_f0[:, 1]),
+                                                                gains=trajectory_gains,
+                                                                sonification_duration=sonification_duration,
+                                                                fs=fs,
+                                                                f0s_stretched=f0s_stretched,
+                                                                gains_stretched=gains_stretched)
+
+        trajectory_sonification = generate_tone_instantaneous_phase(frequency_vector=f0s_stretched,
+                                                                    gain_vector=gains_stretched,
+                                                                    partials=partials,
+                                                                    partials_amplitudes=partials_amplitudes,
+                                                                    partials_phase_offsets=partials_phase_offsets,
+                                                                    fading_duration=fading_duration,
+                                                                    dtype=dtype,
+                                                                    fs=fs)
+
+        trajectory_sonification = fade_signal(trajectory_sonification, fs=fs, fading_duration=fading_duration)
+
+        num_out = min(f0_sonification.shape[0], trajectory_sonification.shape[0])
+        f0_sonification[:num_out] += trajectory_sonification[:num_out]
+
+    f0_sonification = normalize_signal(f0_sonification) if normalize else f0_sonification
+
+    return f0_sonification
+
+
+def __stretch_f0_and_gains(time_positions: np.ndarray,
+                           f0s: np.ndarray,
+                           gains: np.ndarray,
+                           sonification_duration: int = None,
+                           fs: int = 22050,
+                           f0s_stretched: np.ndarray = None,
+                           gains_stretched: np.ndarray = None):
+    # Segment boundaries in samples, shared by the duration handling and both stretched arrays
+    segment_bounds = (time_positions * fs).astype(np.int64)
+    num_samples = int(segment_bounds[-1])
 
-    shorter_duration = False
     if sonification_duration is not None:
         duration_in_sec = sonification_duration / fs
 
@@ -81,42 +243,50 @@ def sonify_f0(time_f0: np.ndarray,
         if sonification_duration == num_samples:
             pass
 
-        # if sonification_duration is less than num_samples, crop the arrays
+        # if sonification_duration is less than num_samples, crop the arrays;
+        # the time positions are sorted, so the crop point is found with a binary search
         elif sonification_duration < num_samples:
-            time_positions = time_positions[time_positions < duration_in_sec]
-            time_positions = np.append(time_positions, duration_in_sec)
-            f0s = f0s[:time_positions.shape[0]]
-            shorter_duration = True
-        # if sonification_duration is greater than num_samples, append
+            num_kept = np.searchsorted(time_positions, duration_in_sec, side='left')
+            cropped_times = np.empty(num_kept + 1)
+            cropped_times[:num_kept] = time_positions[:num_kept]
+            cropped_times[num_kept] = duration_in_sec
+            time_positions = cropped_times
+            f0s = f0s[:num_kept]
+            gains = gains[:num_kept]
+        # if sonification_duration is greater than num_samples,
+        # extend the arrays into preallocated targets with a sentinel entry at the end
         else:
-            time_positions = np.append(time_positions, duration_in_sec)
-            f0s = np.append(f0s, 0.0)
+            num_original = time_positions.shape[0]
+            extended_times = np.empty(num_original + 1)
+            extended_times[:num_original] = time_positions
+            extended_times[num_original] = duration_in_sec
+            time_positions = extended_times
 
-        num_samples = int(time_positions[-1] * fs)
+            extended_f0s = np.zeros(num_original + 1)
+            extended_f0s[:num_original] = f0s
+            f0s = extended_f0s
 
-    f0s_stretched = np.zeros(num_samples)
-    gains_stretched = np.zeros(num_samples)
+            extended_gains = np.zeros(num_original + 1)
+            extended_gains[:num_original] = gains
+            gains = extended_gains
 
-    # Stretch f0s_stretched to match the given time positions.
-    for i, (time, f0, gain) in enumerate(zip(time_positions, f0s, gains)):
-        if i == time_positions.shape[0] - 1:
-            if not shorter_duration:
-                f0s_stretched[int(time_positions[i] * fs):] = 0.0
-                gains_stretched[int(time_positions[i] * fs):] = 0.0
-        else:
-            next_time = time_positions[i + 1]
-            f0s_stretched[int(time * fs):int(next_time * fs)] = f0
-            gains_stretched[int(time * fs):int(next_time * fs)] = gain
+        segment_bounds = (time_positions * fs).astype(np.int64)
+        num_samples = int(segment_bounds[-1])
 
-    f0_sonification = generate_tone_instantaneous_phase(frequency_vector=f0s_stretched,
-                                                        gain_vector=gains_stretched,
-                                                        partials=partials,
-                                                        partials_amplitudes=partials_amplitudes,
-                                                        partials_phase_offsets=partials_phase_offsets,
-                                                        fading_duration=fading_duration,
-                                                        fs=fs)
+    # Reuse the provided scratch buffers when their length still matches
+    if f0s_stretched is None or f0s_stretched.shape[0] != num_samples:
+        f0s_stretched = np.zeros(num_samples)
+        gains_stretched = np.zeros(num_samples)
+    else:
+        f0s_stretched[:] = 0.0
+        gains_stretched[:] = 0.0
 
-    f0_sonification = fade_signal(f0_sonification, fs=fs, fading_duration=fading_duration)
-    f0_sonification = normalize_signal(f0_sonification) if normalize else f0_sonification
+    # Stretch f0s and gains to match the given time positions:
+    # take the segment lengths from the shared boundaries and repeat each segment value,
+    # instead of looping over the segments in Python.
+    lengths = np.diff(segment_bounds)
+    num_segments = segment_bounds.shape[0] - 1
+    f0s_stretched[segment_bounds[0]:segment_bounds[-1]] = np.repeat(f0s[:num_segments], lengths)
+    gains_stretched[segment_bounds[0]:segment_bounds[-1]] = np.repeat(gains[:num_segments], lengths)
 
-    return f0_sonification
+    return f0s_stretched, gains_stretched
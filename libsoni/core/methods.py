@@ -1,8 +1,97 @@
+import math
 import numpy as np
 from typing import Tuple
 
 from libsoni.util.utils import fade_signal, smooth_weights, normalize_signal, pitch_to_frequency
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Block length for the parallel synthesis kernel, in samples.
+# Chosen so that each block's slice of the input and output arrays
+# stays within the per-core cache instead of streaming through DRAM.
+_SYNTH_BLOCK_SIZE = 1 << 15
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def __synthesize_instantaneous_phase(phase_steps: np.ndarray,
+                                         gain_vector: np.ndarray,
+                                         partials: np.ndarray,
+                                         partials_amplitudes: np.ndarray,
+                                         scaled_phase_offsets: np.ndarray,
+                                         num_fade_samples: int,
+                                         fade_scale: float,
+                                         generated_tone: np.ndarray):
+        num_samples = phase_steps.shape[0]
+        num_blocks = (num_samples + _SYNTH_BLOCK_SIZE - 1) // _SYNTH_BLOCK_SIZE
+
+        # Serial pass: phase carried into each block, so the blocks can be synthesized independently
+        block_phases = np.empty(num_blocks)
+        phase_carry = 0.0
+        for block in range(num_blocks):
+            block_phases[block] = phase_carry
+            block_end = min((block + 1) * _SYNTH_BLOCK_SIZE, num_samples)
+            for i in range(block * _SYNTH_BLOCK_SIZE, block_end):
+                phase_carry += phase_steps[i]
+
+        # Parallel pass: per-block phase accumulation, sine synthesis and gain scaling,
+        # fused into one scalar loop without per-block scratch buffers
+        for block in prange(num_blocks):
+            start = block * _SYNTH_BLOCK_SIZE
+            end = min(start + _SYNTH_BLOCK_SIZE, num_samples)
+
+            phase = block_phases[block]
+            for i in range(start, end):
+                phase += phase_steps[i]
+                gain = gain_vector[i]
+                # Silent samples contribute nothing, so the sines can be skipped;
+                # the phase still advances to keep the following samples seamless.
+                if gain == 0.0:
+                    generated_tone[i] = 0.0
+                else:
+                    tone = 0.0
+                    for p in range(partials.shape[0]):
+                        tone += math.sin(phase * partials[p] + scaled_phase_offsets[p]) * partials_amplitudes[p]
+                    # Fade envelope fused into the write-out instead of an extra pass
+                    if num_samples < 2 * num_fade_samples:
+                        tone *= math.sin(math.pi * i / num_samples)
+                    elif i < num_fade_samples:
+                        tone *= math.sin(fade_scale * i)
+                    elif i >= num_samples - num_fade_samples:
+                        tone *= math.cos(fade_scale * (i - (num_samples - num_fade_samples)))
+                    generated_tone[i] = tone * gain
+
+else:
+    # Vectorized NumPy fallback used when Numba is not installed,
+    # tiled over the same block length as the compiled kernel
+    def __synthesize_instantaneous_phase(phase_steps: np.ndarray,
+                                         gain_vector: np.ndarray,
+                                         partials: np.ndarray,
+                                         partials_amplitudes: np.ndarray,
+                                         scaled_phase_offsets: np.ndarray,
+                                         num_fade_samples: int,
+                                         fade_scale: float,
+                                         generated_tone: np.ndarray):
+        num_samples = phase_steps.shape[0]
+        phase_carry = 0.0
+        for start in range(0, num_samples, _SYNTH_BLOCK_SIZE):
+            end = min(start + _SYNTH_BLOCK_SIZE, num_samples)
+            phase = np.cumsum(phase_steps[start:end]) + phase_carry
+            phases = phase[:, None] * partials[None, :] + scaled_phase_offsets[None, :]
+            np.sin(phases, out=phases)
+            generated_tone[start:end] = (phases @ partials_amplitudes) * gain_vector[start:end]
+            phase_carry = phase[-1]
+
+        if num_samples < 2 * num_fade_samples:
+            generated_tone *= np.sin(np.pi * np.arange(num_samples) / num_samples)
+        elif num_fade_samples > 0:
+            fade_ramp = np.arange(num_fade_samples)
+            generated_tone[:num_fade_samples] *= np.sin(fade_scale * fade_ramp)
+            generated_tone[num_samples - num_fade_samples:] *= np.cos(fade_scale * fade_ramp)
+
 
 def generate_click(pitch: int = 69,
                    amplitude: float = 1.0,
@@ -77,7 +166,10 @@ def generate_sinusoid(frequency: float = 440.0,
     sinusoid: np.ndarray (np.float32) [shape=(M, )]
         Generated sinusoid.
     """
-    sinusoid = amplitude * np.sin((2 * np.pi * frequency * (np.arange(int(duration * fs)) / fs)) + phase)
+    sinusoid = amplitude * __generate_cw_recursive_doubling(frequency=frequency,
+                                                            phase=phase,
+                                                            num_samples=int(duration * fs),
+                                                            fs=fs)
     sinusoid = fade_signal(signal=sinusoid, fs=fs, fading_duration=fading_duration)
 
     return sinusoid
@@ -154,11 +246,15 @@ def generate_shepard_tone(pitch_class: int = 0,
 
         for shepard_frequency in shepard_frequencies:
             shepard_tone += weights[np.argmin(np.abs(f_log - shepard_frequency))] * \
-                            np.sin(2 * np.pi * shepard_frequency * np.arange(int(duration * fs)) / fs)
+                            __generate_cw_recursive_doubling(frequency=shepard_frequency,
+                                                             num_samples=int(duration * fs),
+                                                             fs=fs)
 
     else:
         for shepard_frequency in shepard_frequencies:
-            shepard_tone += np.sin(2 * np.pi * shepard_frequency * np.arange(int(duration * fs)) / fs)
+            shepard_tone += __generate_cw_recursive_doubling(frequency=shepard_frequency,
+                                                             num_samples=int(duration * fs),
+                                                             fs=fs)
 
     shepard_tone = fade_signal(signal=shepard_tone, fs=fs, fading_duration=fading_duration)
     shepard_tone = normalize_signal(shepard_tone) * gain
@@ -230,8 +326,12 @@ def generate_tone_additive_synthesis(pitch: int = 69,
     generated_tone = np.zeros(int(duration * fs))
     pitch_frequency = pitch_to_frequency(pitch=pitch, tuning_frequency=tuning_frequency)
 
+    # Time axis and angular frequency are hoisted out of the partial loop
+    time_axis = np.arange(int(duration * fs)) / fs
+    angular_frequency = 2 * np.pi * pitch_frequency
+
     for partial, partial_amplitude, partials_phase_offset in zip(partials, partials_amplitudes, partials_phase_offsets):
-        generated_tone += partial_amplitude * np.sin(2 * np.pi * pitch_frequency * partial * (np.arange(int(duration * fs)) / fs) + partials_phase_offset)
+        generated_tone += partial_amplitude * np.sin(angular_frequency * partial * time_axis + partials_phase_offset)
 
     generated_tone = fade_signal(signal=generated_tone, fs=fs, fading_duration=fading_duration) * gain
 
@@ -285,9 +385,10 @@ def generate_tone_fm_synthesis(pitch: int = 69,
     assert 0 <= pitch <= 127, f'Pitch is out of range [0,127].'
 
     pitch_frequency = pitch_to_frequency(pitch=pitch, tuning_frequency=tuning_frequency)
-    generated_tone = np.sin(2 * np.pi * pitch_frequency * (np.arange(int(duration * fs))) / fs +
+    sample_indices = np.arange(int(duration * fs))
+    generated_tone = np.sin(2 * np.pi * pitch_frequency * sample_indices / fs +
                             modulation_amplitude * np.sin(2 * np.pi * pitch_frequency * modulation_rate_relative *
-                                                          (np.arange(int(duration * fs)))))
+                                                          sample_indices))
     generated_tone = gain * fade_signal(signal=generated_tone, fs=fs, fading_duration=fading_duration)
 
     return generated_tone
@@ -357,6 +458,7 @@ def generate_tone_instantaneous_phase(frequency_vector: np.ndarray,
                                       partials_amplitudes: np.ndarray = None,
                                       partials_phase_offsets: np.ndarray = None,
                                       fading_duration: float = 0.05,
+                                      dtype: np.dtype = np.float32,
                                       fs: int = 22050) -> np.ndarray:
     """Generates signal out of instantaneous frequency.
 
@@ -386,6 +488,11 @@ def generate_tone_instantaneous_phase(frequency_vector: np.ndarray,
     fading_duration: float, default: 0.01
         Determines duration of fade-in and fade-out, given in seconds.
 
+    dtype: np.dtype, default = np.float32
+        Dtype of the generated signal.
+        The instantaneous phase is always accumulated in double precision;
+        the dtype only affects the synthesized output samples.
+
     fs: int, default = 22050
         Sampling rate, in samples per seconds.
 
@@ -400,28 +507,74 @@ def generate_tone_instantaneous_phase(frequency_vector: np.ndarray,
     if not (len(partials) == len(partials_amplitudes) == len(partials_phase_offsets)):
         raise ValueError('Partials, Partials_amplitudes and Partials_phase_offsets must be of equal length.')
 
-    generated_tone = np.zeros_like(frequency_vector)
-
     if gain_vector is None:
         gain_vector = np.ones_like(frequency_vector)
 
     else:
         gain_vector = smooth_weights(weights=gain_vector, fading_samples=60)
 
-    phase = 0
-    phase_result = []
+    # Synthesize in a single fused pass over blocks of samples: phase accumulation,
+    # sine synthesis for all partials and gain scaling happen inside one compiled kernel.
+    # All per-partial constants are precomputed here, outside the per-sample path.
+    phase_steps = 2 * np.pi * np.asarray(frequency_vector, dtype=np.float64) / fs
+    partials = np.asarray(partials, dtype=np.float64)
+    scaled_phase_offsets = np.asarray(partials_phase_offsets, dtype=np.float64) * partials
+
+    # Fade parameters for the envelope fused into the kernel (cf. fade_signal)
+    num_fade_samples = int(fading_duration * fs)
+    fade_scale = np.pi / fading_duration / 2 / fs if num_fade_samples > 0 else 0.0
+
+    generated_tone = np.empty(phase_steps.shape[0], dtype=dtype)
+    __synthesize_instantaneous_phase(phase_steps,
+                                     np.asarray(gain_vector, dtype=np.float64),
+                                     partials,
+                                     np.asarray(partials_amplitudes, dtype=np.float64),
+                                     scaled_phase_offsets,
+                                     num_fade_samples,
+                                     fade_scale,
+                                     generated_tone)
 
-    for frequency, gain in zip(frequency_vector, gain_vector):
-        phase_step = 2 * np.pi * frequency / fs
-        phase += phase_step
-        phase_result.append(phase)
+    return generated_tone
 
-    phase_result = np.asarray(phase_result)
 
-    for partial, partial_amplitude, partials_phase_offset in zip(partials, partials_amplitudes, partials_phase_offsets):
-        generated_tone += np.sin((phase_result + partials_phase_offset) * partial) * partial_amplitude
+def __generate_cw_recursive_doubling(frequency: float,
+                                     phase: float = 0.0,
+                                     num_samples: int = 0,
+                                     fs: int = 22050) -> np.ndarray:
+    """Generates a continuous sinusoid by recursive doubling of complex exponentials.
 
-    generated_tone = generated_tone * gain_vector
-    generated_tone = fade_signal(signal=generated_tone, fs=fs, fading_duration=fading_duration)
+    The powers of the per-sample phasor are obtained by repeatedly squaring and
+    concatenating the already computed block, requiring only O(log N) transcendental
+    evaluations instead of one sine per sample.
 
-    return generated_tone
+    Parameters
+    ----------
+    frequency: float
+        Frequency of the sinusoid, in Hertz.
+
+    phase: float, default: 0.0
+        Phase of the sinusoid.
+
+    num_samples: int, default: 0
+        Number of samples to generate.
+
+    fs: int, default = 22050
+        Sampling rate, in samples per seconds.
+
+    Returns
+    -------
+    sinusoid: np.ndarray (np.float64) [shape=(num_samples, )]
+        Generated sinusoid.
+    """
+    if num_samples < 1:
+        return np.zeros(num_samples)
+
+    rotation = np.exp(2j * np.pi * frequency / fs)
+    phasors = np.array([1.0 + 0.0j, rotation])
+
+    while phasors.shape[0] < num_samples:
+        phasors = np.concatenate((phasors, phasors * (phasors[-1] * rotation)))
+
+    sinusoid = (np.exp(1j * phase) * phasors[:num_samples]).imag
+
+    return sinusoid
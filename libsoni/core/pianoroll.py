@@ -205,15 +205,24 @@ def sonify_pianoroll_sample(pianoroll_df: pd.DataFrame,
     else:
         pianoroll_df['velocity'] = 1
 
+    # Pitch-shifting dominates the cost per note and identical events
+    # (same pitch, duration and velocity) are common in polyphonic annotations,
+    # so the warped samples are cached and reused within this call.
+    warped_samples = {}
+
     for i, r in pianoroll_df.iterrows():
         start_samples = int(r['start'] * fs)
-        warped_sample = warp_sample(sample=sample,
-                                    reference_pitch=reference_pitch,
-                                    target_pitch=r['pitch'],
-                                    target_duration_sec=r['duration'],
-                                    gain=r['velocity'],
-                                    fading_duration=note_fading_duration,
-                                    fs=fs)
+        event_key = (r['pitch'], r['duration'], r['velocity'])
+        warped_sample = warped_samples.get(event_key)
+        if warped_sample is None:
+            warped_sample = warp_sample(sample=sample,
+                                        reference_pitch=reference_pitch,
+                                        target_pitch=r['pitch'],
+                                        target_duration_sec=r['duration'],
+                                        gain=r['velocity'],
+                                        fading_duration=note_fading_duration,
+                                        fs=fs)
+            warped_samples[event_key] = warped_sample
         pianoroll_sonification[start_samples:start_samples + len(warped_sample)] += warped_sample
 
     pianoroll_sonification = fade_signal(pianoroll_sonification, fs=fs, fading_duration=signal_fading_duration)
@@ -65,7 +65,8 @@ def sonify_tse_clicks(time_positions: np.ndarray = None,
     else:
         if sonification_duration < num_samples:
             duration_in_sec = sonification_duration / fs
-            time_positions = time_positions[time_positions < duration_in_sec]
+            # time positions are sorted, so the crop point is found with a binary search
+            time_positions = time_positions[:np.searchsorted(time_positions, duration_in_sec, side='left')]
         num_samples = int(sonification_duration * fs)
 
     click = generate_click(pitch=click_pitch,
@@ -136,7 +137,8 @@ def sonify_tse_sample(time_positions: np.ndarray = None,
     else:
         if sonification_duration < num_samples:
             duration_in_sec = sonification_duration / fs
-            time_positions = time_positions[time_positions < duration_in_sec]
+            # time positions are sorted, so the crop point is found with a binary search
+            time_positions = time_positions[:np.searchsorted(time_positions, duration_in_sec, side='left')]
 
         num_samples = sonification_duration
 
@@ -1,15 +1,22 @@
-import librosa
-import libfmp.b
-import libfmp.c6
-import libfmp.b
 import matplotlib
 from matplotlib import pyplot as plt
 from matplotlib import patches
-from numba import jit
 import numpy as np
 import pandas as pd
 from typing import Tuple
 
+# librosa and libfmp are imported inside the functions that use them:
+# both import numba at module level, which would defeat the optional-numba fallbacks below.
+
+try:
+    from numba import jit
+except ImportError:
+    # Numba is optional: without it the decorated functions run as plain Python
+    def jit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 SAMPLES = ['bass-drum', 'click', 'hi-hat']
 
 
@@ -103,6 +110,8 @@ def warp_sample(sample: np.ndarray,
     warped_sample: np.ndarray (np.float32 / np.float64) [shape=(M, )]
         Warped sample.
     """
+    import librosa
+
     # Compute pitch difference
     pitch_steps = target_pitch - reference_pitch
 
@@ -158,6 +167,10 @@ def pitch_to_frequency(pitch: int,
 
 # Taken from FMP Notebooks, https://www.audiolabs-erlangen.de/resources/MIR/FMP/C6/C6S2_TempoBeat.html
 def plot_sonify_novelty_beats(fn_wav, fn_ann, title=''):
+    import librosa
+    import libfmp.b
+    import libfmp.c6
+
     ann, label_keys = libfmp.c6.read_annotation_pos(fn_ann, label='onset', header=0)
     df = pd.read_csv(fn_ann, sep=';', keep_default_na=False, header=None)
     Fs = 22050
@@ -350,6 +363,7 @@ def visualize_pianoroll(pianoroll_df: pd.DataFrame,
     ax: matplotlib.axes.Axes
          Axes object
     """
+    import libfmp.b
 
     pianoroll_df = format_df(pianoroll_df)
     fig = None
@@ -56,3 +56,79 @@ class TestF0(TestCase):
                 self.assertEqual(len(y), len(ref), msg='Length of the generated sonification '
                                                        'does not match with the reference!')
                 assert np.allclose(y, ref, atol=1e-4, rtol=1e-5)
+
+    def test_sonification_multi(self) -> None:
+        duration = self.durations[0]
+        time_f0s = [self.time_f0, self.time_f0[:5]]
+
+        y = f0.sonify_f0_multi(time_f0s=time_f0s,
+                               partials=self.partials[1],
+                               partials_amplitudes=self.partials_amplitudes[1],
+                               sonification_duration=duration,
+                               fs=self.fs)
+
+        ref = np.zeros(duration)
+        for time_f0 in time_f0s:
+            ref += f0.sonify_f0(time_f0=time_f0,
+                                partials=self.partials[1],
+                                partials_amplitudes=self.partials_amplitudes[1],
+                                sonification_duration=duration,
+                                normalize=False,
+                                fs=self.fs)
+        ref /= np.max(np.abs(ref))
+
+        self.assertEqual(len(y), duration, msg='Length of the generated sonification '
+                                               'does not match with the requested duration!')
+        assert np.allclose(y, ref, atol=1e-4, rtol=1e-5)
+
+    def test_out_accumulation(self) -> None:
+        duration = self.durations[0]
+        expected = f0.sonify_f0(time_f0=self.time_f0,
+                                sonification_duration=duration,
+                                normalize=False,
+                                fs=self.fs)
+
+        out = np.zeros(duration)
+        returned = f0.sonify_f0(time_f0=self.time_f0,
+                                sonification_duration=duration,
+                                out=out,
+                                fs=self.fs)
+        self.assertIs(returned, out, msg='The provided buffer must be returned!')
+        assert np.allclose(out, expected, atol=1e-4, rtol=1e-5)
+
+        # A second call adds on top of the buffer without normalization
+        _ = f0.sonify_f0(time_f0=self.time_f0,
+                         sonification_duration=duration,
+                         out=out,
+                         fs=self.fs)
+        assert np.allclose(out, 2 * expected, atol=1e-4, rtol=1e-5)
+
+        # A shorter buffer only accumulates its own length
+        out_short = np.zeros(duration // 2)
+        _ = f0.sonify_f0(time_f0=self.time_f0,
+                         sonification_duration=duration,
+                         out=out_short,
+                         fs=self.fs)
+        assert np.allclose(out_short, expected[:duration // 2], atol=1e-4, rtol=1e-5)
+
+    def test_dtype(self) -> None:
+        duration = self.durations[0]
+        y_float32 = f0.sonify_f0(time_f0=self.time_f0,
+                                 sonification_duration=duration,
+                                 fs=self.fs)
+        y_float64 = f0.sonify_f0(time_f0=self.time_f0,
+                                 sonification_duration=duration,
+                                 dtype=np.float64,
+                                 fs=self.fs)
+
+        self.assertEqual(y_float32.dtype, np.float32)
+        self.assertEqual(y_float64.dtype, np.float64)
+        assert np.allclose(y_float32, y_float64, atol=1e-4, rtol=1e-5)
+
+    def test_multi_invalid_gains(self) -> None:
+        with self.assertRaises(AssertionError) as context:
+            _ = f0.sonify_f0_multi(time_f0s=[self.time_f0],
+                                   gains=[np.ones(self.time_f0.shape[0] + 1)],
+                                   fs=self.fs)
+
+        self.assertEqual(str(context.exception), 'Array for confidence must have same length as time_f0.')
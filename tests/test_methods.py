@@ -1,5 +1,7 @@
 import numpy as np
 import soundfile as sf
+import subprocess
+import sys
 from unittest import TestCase
 
 from libsoni.core.methods import generate_click, generate_shepard_tone, generate_sinusoid,\
@@ -61,3 +63,38 @@ class TestMethods(TestCase):
                     self.assertEqual(len(y), len(ref), msg='Length of the generated sonification '
                                                            'does not match with the reference!')
                     assert np.allclose(y, ref, atol=1e-4, rtol=1e-5)
+
+    def test_instantaneous_phase_dtype(self) -> None:
+        y_float32 = generate_tone_instantaneous_phase(self.frequency_vector, fs=self.fs)
+        y_float64 = generate_tone_instantaneous_phase(self.frequency_vector, dtype=np.float64, fs=self.fs)
+
+        self.assertEqual(y_float32.dtype, np.float32)
+        self.assertEqual(y_float64.dtype, np.float64)
+        assert np.allclose(y_float32, y_float64, atol=1e-4, rtol=1e-5)
+
+    def test_numpy_fallback(self) -> None:
+        # Run in a fresh interpreter with numba blocked,
+        # so importing libsoni activates the NumPy fallback kernel
+        script = (
+            "import sys\n"
+            "sys.modules['numba'] = None\n"
+            "import numpy as np\n"
+            "import soundfile as sf\n"
+            "import libsoni.core.methods as methods\n"
+            "assert methods.njit is None, 'NumPy fallback is not active'\n"
+            "from libsoni.core import f0\n"
+            "c_major_scale = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25, 0.0]\n"
+            "time_positions = np.arange(0.2, len(c_major_scale) * 0.5, 0.5)\n"
+            "time_f0 = np.column_stack((time_positions, c_major_scale))\n"
+            "fs = 22050\n"
+            "y = f0.sonify_f0(time_f0=time_f0,\n"
+            "                 partials=np.array([1, 2, 3]),\n"
+            "                 partials_amplitudes=np.array([1, 0.5, 0.25]),\n"
+            "                 sonification_duration=int(3.0 * fs),\n"
+            "                 fs=fs)\n"
+            "ref, _ = sf.read('tests/data/f0_66150_1.wav')\n"
+            "assert len(y) == len(ref), 'Length of the generated sonification does not match with the reference!'\n"
+            "assert np.allclose(y, ref, atol=1e-4, rtol=1e-5)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True)
+        self.assertEqual(result.returncode, 0, msg=result.stderr.decode())